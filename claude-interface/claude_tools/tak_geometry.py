@@ -5,13 +5,129 @@ This module provides natural language interfaces for creating TAK objects
 like circles, polygons, routes, and markers.
 """
 
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from enum import Enum
+import functools
+import itertools
+import os
+import time
 import uuid
 
 
-@dataclass
+class Color(str, Enum):
+    """Map colors; each value is the ARGB signed 32-bit int TAK expects"""
+    RED = "-65536"
+    GREEN = "-16711936"
+    BLUE = "-16776961"
+    YELLOW = "-256"
+
+
+# Color lookup keyed by both lowercase name and Color member. A member hashes
+# like its value, so either kind of key resolves with one dict lookup.
+_COLOR_VALUES = {color.name.lower(): color.value for color in Color}
+_COLOR_VALUES.update({color: color.value for color in Color})
+
+# Marker type mapping (MIL-STD-2525)
+_MARKER_TYPES = {
+    "friendly": "a-f-G-E-S",       # Friendly ground equipment
+    "hostile": "a-h-G-E-S",        # Hostile ground equipment
+    "neutral": "a-n-G-E-S",        # Neutral
+    "unknown": "a-u-G-E-S",        # Unknown
+    "emergency": "b-a-o-tl",       # Emergency beacon
+    "medical": "b-m-p-c",          # Medical casualty
+}
+
+# Constant XML fragments shared by every CoT event. Builders interleave these
+# with the per-event values and ''.join() the result, which avoids re-parsing
+# one large f-string template on every call.
+_XML_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<event version="2.0" uid="'
+_SHAPE_EVENT_ATTRS = '" type="u-d-f" how="h-g-i-g-o">\n  <point lat="'
+_ROUTE_EVENT_ATTRS = '" type="b-m-p-s-p-loc" how="h-g-i-g-o">\n  <point lat="'
+_TYPE_ATTR = '" type="'
+_MARKER_EVENT_ATTRS = '" how="h-g-i-g-o">\n  <point lat="'
+_LON_ATTR = '" lon="'
+_HAE_ATTR = '" hae="'
+_POINT_TAIL_UNKNOWN = '" ce="9999999" le="9999999"/>\n  <time>'
+_POINT_TAIL_PRECISE = '" ce="10" le="10"/>\n  <time>'
+_TIME_TO_START = 'Z</time>\n  <start>'
+_START_TO_STALE = 'Z</start>\n  <stale>'
+_STALE_TO_CALLSIGN = 'Z</stale>\n  <detail>\n    <contact callsign="'
+_CALLSIGN_END = '"/>\n'
+_LABELS_ON = '    <labels_on value="true"/>\n'
+_EVENT_TAIL = '  </detail>\n</event>'
+_SHAPE_TAIL = '    <strokeWeight value="2.0"/>\n' + _LABELS_ON + _EVENT_TAIL
+
+# Pre-rendered <color>/<strokeColor> pair for each named color
+_COLOR_XML = {
+    name: f'    <color value="{value}"/>\n    <strokeColor value="{value}"/>\n'
+    for name, value in _COLOR_VALUES.items()
+}
+_FILL_XML = '    <fillColor value="1342177280"/>\n'  # Semi-transparent
+_NO_FILL_XML = '    <fillColor value="0"/>\n'
+_WAYPOINT_LINK_HEAD = '<link relation="c" type="b-m-p-s-p-loc" uid="'
+_ELEMENT_END = '"/>'
+_VERTEX_FMT = '<vertex lat="%s" lon="%s" hae="%s"/>'
+_VERTEX_SEP = '\n        '
+
+_XML_ESCAPES = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
+# Memoized timestamps for the current second, keyed by stale hours
+_ISO_FMT = "%04d-%02d-%02dT%02d:%02d:%02d"
+_iso_second = -1
+_iso_cache: Dict[int, Tuple[str, str]] = {}
+
+# Generated UIDs only need to be unique for the life of the process, so a
+# per-process prefix plus a counter replaces a CSPRNG read per event.
+_UID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}-"
+_UID_COUNTER = itertools.count()
+
+
+def _new_uid(kind: str, secure_uid: bool = False) -> str:
+    """Generate a UID like ``circle-<pid>-<start>-<n>`` (``circle-<uuid4>`` if secure)"""
+    if secure_uid:
+        return f"{kind}-{uuid.uuid4()}"
+    return f"{kind}-{_UID_PREFIX}{next(_UID_COUNTER):x}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _xml_escape(text: str) -> str:
+    """Escape user text for XML content or attribute values
+
+    Cached because the same callsigns and names recur across many events.
+    """
+    return text.translate(_XML_ESCAPES)
+
+
+def _utc_iso_now(stale_hours: int) -> Tuple[str, str]:
+    """Return (now, now + stale_hours) as ISO-8601 UTC strings (without the 'Z')
+
+    Timestamps have one-second resolution, so the formatted pair is memoized
+    until the clock reaches the next second. A burst of events (e.g. a route
+    and all its waypoints) formats its timestamps once.
+    """
+    global _iso_second
+    second = time.time_ns() // 1_000_000_000
+    if second != _iso_second:
+        _iso_cache.clear()
+        _iso_second = second
+
+    cached = _iso_cache.get(stale_hours)
+    if cached is None:
+        cached = _iso_cache[stale_hours] = (
+            _ISO_FMT % time.gmtime(second)[:6],
+            _ISO_FMT % time.gmtime(second + stale_hours * 3600)[:6],
+        )
+    return cached
+
+
+@dataclass(slots=True)
 class LatLon:
     """Geographic coordinate"""
     lat: float
@@ -19,25 +135,55 @@ class LatLon:
     hae: float = 0.0  # Height above ellipsoid
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     """Circle geometry for exclusion zones, range rings"""
     center: LatLon
     radius_meters: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Polygon:
-    """Polygon geometry for areas, zones"""
+    """Polygon geometry for areas, zones
+
+    Large polygons can skip the per-vertex LatLon objects by carrying an
+    (N, 3) float64 array of (lat, lon, hae) rows in ``vertices_array``
+    instead; see ``from_array``. ``vertices`` is empty in that case.
+    """
     vertices: List[LatLon]
+    vertices_array: Optional[Any] = None  # numpy.ndarray, shape (N, 3)
 
+    @classmethod
+    def from_array(cls, arr: Any) -> "Polygon":
+        """Create an array-backed polygon from an (N, 3) lat/lon/hae array"""
+        return cls(vertices=[], vertices_array=arr)
 
-@dataclass
+    def coords(self) -> List[float]:
+        """Flat [lat, lon, hae, lat, lon, hae, ...] list of vertex coordinates"""
+        if self.vertices_array is not None:
+            return list(itertools.chain.from_iterable(self.vertices_array.tolist()))
+        coords = []
+        for v in self.vertices:
+            coords += (v.lat, v.lon, v.hae)
+        return coords
+
+
+@dataclass(slots=True)
 class Route:
     """Route/path with waypoints"""
     waypoints: List[Tuple[LatLon, str]]  # (position, name)
 
 
+def _format_vertices(coords: List[float]) -> str:
+    """Render flat lat/lon/hae coordinates as <vertex/> elements
+
+    All vertices are formatted against one repeated template with a single
+    %-format, so the per-vertex work happens inside str.__mod__ rather than
+    in a Python-level f-string per vertex.
+    """
+    return _VERTEX_SEP.join([_VERTEX_FMT] * (len(coords) // 3)) % tuple(coords)
+
+
 class CotMessageBuilder:
     """Builds CoT XML messages for TAK objects"""
 
@@ -46,7 +192,8 @@ class CotMessageBuilder:
         circle: Circle,
         callsign: str,
         color: str = "red",
-        uid: Optional[str] = None
+        uid: Optional[str] = None,
+        secure_uid: bool = False
     ) -> str:
         """
         Create a CoT event for a circular zone
@@ -54,44 +201,34 @@ class CotMessageBuilder:
         Args:
             circle: Circle geometry
             callsign: Display name for the circle
-            color: Color (red, green, blue, yellow)
+            color: Color name (red, green, blue, yellow) or Color member
             uid: Unique identifier (generated if None)
+            secure_uid: Generate the uid with uuid4 instead of the process counter
 
         Returns:
             CoT XML message string
         """
-        uid = uid or f"circle-{uuid.uuid4()}"
-        now = datetime.utcnow()
-        stale = now + timedelta(hours=24)
-
-        # Color mapping
-        colors = {
-            "red": "-65536",
-            "green": "-16711936",
-            "blue": "-16776961",
-            "yellow": "-256"
-        }
-        color_value = colors.get(color, "-65536")
-
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<event version="2.0" uid="{uid}" type="u-d-f" how="h-g-i-g-o">
-  <point lat="{circle.center.lat}" lon="{circle.center.lon}" hae="{circle.center.hae}" ce="9999999" le="9999999"/>
-  <time>{now.isoformat()}Z</time>
-  <start>{now.isoformat()}Z</start>
-  <stale>{stale.isoformat()}Z</stale>
-  <detail>
-    <contact callsign="{callsign}"/>
-    <link uid="{uid}" type="a-f-G-E-V-C" relation="p-p"/>
-    <shape>
-      <ellipse major="{circle.radius_meters}" minor="{circle.radius_meters}" angle="0"/>
-    </shape>
-    <color value="{color_value}"/>
-    <strokeColor value="{color_value}"/>
-    <strokeWeight value="2.0"/>
-    <labels_on value="true"/>
-  </detail>
-</event>'''
-        return xml
+        uid = uid or _new_uid("circle", secure_uid)
+        now_iso, stale_iso = _utc_iso_now(24)
+
+        color_xml = _COLOR_XML.get(color, _COLOR_XML["red"])
+
+        center = circle.center
+        radius = str(circle.radius_meters)
+        return ''.join([
+            _XML_HEAD, uid, _SHAPE_EVENT_ATTRS,
+            str(center.lat), _LON_ATTR, str(center.lon), _HAE_ATTR, str(center.hae),
+            _POINT_TAIL_UNKNOWN, now_iso,
+            _TIME_TO_START, now_iso,
+            _START_TO_STALE, stale_iso,
+            _STALE_TO_CALLSIGN, _xml_escape(callsign), _CALLSIGN_END,
+            '    <link uid="', uid, '" type="a-f-G-E-V-C" relation="p-p"/>\n'
+            '    <shape>\n'
+            '      <ellipse major="', radius, '" minor="', radius, '" angle="0"/>\n'
+            '    </shape>\n',
+            color_xml,
+            _SHAPE_TAIL,
+        ])
 
     @staticmethod
     def create_polygon_event(
@@ -99,7 +236,8 @@ class CotMessageBuilder:
         callsign: str,
         color: str = "green",
         filled: bool = True,
-        uid: Optional[str] = None
+        uid: Optional[str] = None,
+        secure_uid: bool = False
     ) -> str:
         """
         Create a CoT event for a polygon area
@@ -107,64 +245,49 @@ class CotMessageBuilder:
         Args:
             polygon: Polygon geometry
             callsign: Display name
-            color: Border color
+            color: Border color name or Color member
             filled: Whether to fill the polygon
             uid: Unique identifier
+            secure_uid: Generate the uid with uuid4 instead of the process counter
 
         Returns:
             CoT XML message string
         """
-        uid = uid or f"polygon-{uuid.uuid4()}"
-        now = datetime.utcnow()
-        stale = now + timedelta(hours=24)
-
-        colors = {
-            "red": "-65536",
-            "green": "-16711936",
-            "blue": "-16776961",
-            "yellow": "-256"
-        }
-        color_value = colors.get(color, "-16711936")
-        fill_value = "1342177280" if filled else "0"  # Semi-transparent
-
-        # Build vertex list
-        vertices_xml = "\n        ".join(
-            f'<vertex lat="{v.lat}" lon="{v.lon}" hae="{v.hae}"/>'
-            for v in polygon.vertices
-        )
-
-        # Use first vertex as the main point
-        first = polygon.vertices[0]
-
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<event version="2.0" uid="{uid}" type="u-d-f" how="h-g-i-g-o">
-  <point lat="{first.lat}" lon="{first.lon}" hae="{first.hae}" ce="9999999" le="9999999"/>
-  <time>{now.isoformat()}Z</time>
-  <start>{now.isoformat()}Z</start>
-  <stale>{stale.isoformat()}Z</stale>
-  <detail>
-    <contact callsign="{callsign}"/>
-    <link relation="p-p"/>
-    <shape>
-      <polyline closed="true">
-        {vertices_xml}
-      </polyline>
-    </shape>
-    <color value="{color_value}"/>
-    <fillColor value="{fill_value}"/>
-    <strokeColor value="{color_value}"/>
-    <strokeWeight value="2.0"/>
-    <labels_on value="true"/>
-  </detail>
-</event>'''
-        return xml
+        uid = uid or _new_uid("polygon", secure_uid)
+        now_iso, stale_iso = _utc_iso_now(24)
+
+        color_xml = _COLOR_XML.get(color, _COLOR_XML["green"])
+        fill_xml = _FILL_XML if filled else _NO_FILL_XML
+
+        coords = polygon.coords()
+        vertices_xml = _format_vertices(coords)
+
+        return ''.join([
+            _XML_HEAD, uid, _SHAPE_EVENT_ATTRS,
+            # Use first vertex as the main point
+            str(coords[0]), _LON_ATTR, str(coords[1]), _HAE_ATTR, str(coords[2]),
+            _POINT_TAIL_UNKNOWN, now_iso,
+            _TIME_TO_START, now_iso,
+            _START_TO_STALE, stale_iso,
+            _STALE_TO_CALLSIGN, _xml_escape(callsign), _CALLSIGN_END,
+            '    <link relation="p-p"/>\n'
+            '    <shape>\n'
+            '      <polyline closed="true">\n'
+            '        ', vertices_xml, '\n'
+            '      </polyline>\n'
+            '    </shape>\n',
+            color_xml,
+            fill_xml,
+            _SHAPE_TAIL,
+        ])
 
     @staticmethod
     def create_route_event(
         route: Route,
         route_name: str,
         color: str = "yellow",
-        uid: Optional[str] = None
+        uid: Optional[str] = None,
+        secure_uid: bool = False
     ) -> List[str]:
         """
         Create CoT events for a route with waypoints
@@ -172,65 +295,53 @@ class CotMessageBuilder:
         Args:
             route: Route with waypoints
             route_name: Name of the route
-            color: Route color
+            color: Route color name or Color member
             uid: Unique identifier for route
+            secure_uid: Generate the uid with uuid4 instead of the process counter
 
         Returns:
             List of CoT XML messages (route + waypoints)
         """
-        uid = uid or f"route-{uuid.uuid4()}"
-        now = datetime.utcnow()
-        stale = now + timedelta(hours=24)
-
-        colors = {
-            "red": "-65536",
-            "green": "-16711936",
-            "blue": "-16776961",
-            "yellow": "-256"
-        }
-        color_value = colors.get(color, "-256")
-
-        messages = []
+        uid = uid or _new_uid("route", secure_uid)
+        now_iso, stale_iso = _utc_iso_now(24)
+
+        color_value = _COLOR_VALUES.get(color, _COLOR_VALUES["yellow"])
+
         waypoint_links = []
         waypoint_messages = []
 
         # Create waypoint messages and links
         for idx, (position, name) in enumerate(route.waypoints):
             wp_uid = f"{uid}-wp-{idx}"
-            waypoint_links.append(
-                f'<link relation="c" type="b-m-p-s-p-loc" uid="{wp_uid}"/>'
-            )
-
-            wp_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<event version="2.0" uid="{wp_uid}" type="b-m-p-s-p-loc" how="h-g-i-g-o">
-  <point lat="{position.lat}" lon="{position.lon}" hae="{position.hae}" ce="10" le="10"/>
-  <time>{now.isoformat()}Z</time>
-  <start>{now.isoformat()}Z</start>
-  <stale>{stale.isoformat()}Z</stale>
-  <detail>
-    <contact callsign="{name}"/>
-    <labels_on value="true"/>
-  </detail>
-</event>'''
-            waypoint_messages.append(wp_xml)
+            waypoint_links += (_WAYPOINT_LINK_HEAD, wp_uid, _ELEMENT_END)
+
+            waypoint_messages.append(''.join([
+                _XML_HEAD, wp_uid, _ROUTE_EVENT_ATTRS,
+                str(position.lat), _LON_ATTR, str(position.lon),
+                _HAE_ATTR, str(position.hae),
+                _POINT_TAIL_PRECISE, now_iso,
+                _TIME_TO_START, now_iso,
+                _START_TO_STALE, stale_iso,
+                _STALE_TO_CALLSIGN, _xml_escape(name), _CALLSIGN_END,
+                _LABELS_ON,
+                _EVENT_TAIL,
+            ]))
 
         # Create main route message
         first = route.waypoints[0][0]
-        links_xml = "\n    ".join(waypoint_links)
-
-        route_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<event version="2.0" uid="{uid}" type="b-m-p-s-p-loc" how="h-g-i-g-o">
-  <point lat="{first.lat}" lon="{first.lon}" hae="{first.hae}" ce="9999999" le="9999999"/>
-  <time>{now.isoformat()}Z</time>
-  <start>{now.isoformat()}Z</start>
-  <stale>{stale.isoformat()}Z</stale>
-  <detail>
-    <contact callsign="{route_name}"/>
-    {links_xml}
-    <labels_on value="true"/>
-    <color value="{color_value}"/>
-  </detail>
-</event>'''
+
+        route_xml = ''.join([
+            _XML_HEAD, uid, _ROUTE_EVENT_ATTRS,
+            str(first.lat), _LON_ATTR, str(first.lon), _HAE_ATTR, str(first.hae),
+            _POINT_TAIL_UNKNOWN, now_iso,
+            _TIME_TO_START, now_iso,
+            _START_TO_STALE, stale_iso,
+            _STALE_TO_CALLSIGN, _xml_escape(route_name), _CALLSIGN_END,
+            '    ', *waypoint_links, '\n',
+            _LABELS_ON,
+            '    <color value="', color_value, '"/>\n',
+            _EVENT_TAIL,
+        ])
 
         # Return route first, then waypoints
         return [route_xml] + waypoint_messages
@@ -241,7 +352,8 @@ class CotMessageBuilder:
         callsign: str,
         marker_type: str = "friendly",
         remarks: Optional[str] = None,
-        uid: Optional[str] = None
+        uid: Optional[str] = None,
+        secure_uid: bool = False
     ) -> str:
         """
         Create a CoT event for a simple marker
@@ -252,40 +364,30 @@ class CotMessageBuilder:
             marker_type: Type (friendly, hostile, neutral, unknown, emergency, medical)
             remarks: Optional notes
             uid: Unique identifier
+            secure_uid: Generate the uid with uuid4 instead of the process counter
 
         Returns:
             CoT XML message string
         """
-        uid = uid or f"marker-{uuid.uuid4()}"
-        now = datetime.utcnow()
-        stale = now + timedelta(hours=12)
-
-        # Type mapping (MIL-STD-2525)
-        types = {
-            "friendly": "a-f-G-E-S",       # Friendly ground equipment
-            "hostile": "a-h-G-E-S",        # Hostile ground equipment
-            "neutral": "a-n-G-E-S",        # Neutral
-            "unknown": "a-u-G-E-S",        # Unknown
-            "emergency": "b-a-o-tl",       # Emergency beacon
-            "medical": "b-m-p-c",          # Medical casualty
-        }
-        event_type = types.get(marker_type, "a-f-G-E-S")
-
-        remarks_xml = f"<remarks>{remarks}</remarks>" if remarks else ""
-
-        xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<event version="2.0" uid="{uid}" type="{event_type}" how="h-g-i-g-o">
-  <point lat="{position.lat}" lon="{position.lon}" hae="{position.hae}" ce="10" le="10"/>
-  <time>{now.isoformat()}Z</time>
-  <start>{now.isoformat()}Z</start>
-  <stale>{stale.isoformat()}Z</stale>
-  <detail>
-    <contact callsign="{callsign}"/>
-    {remarks_xml}
-    <labels_on value="true"/>
-  </detail>
-</event>'''
-        return xml
+        uid = uid or _new_uid("marker", secure_uid)
+        now_iso, stale_iso = _utc_iso_now(12)
+
+        event_type = _MARKER_TYPES.get(marker_type, _MARKER_TYPES["friendly"])
+
+        parts = [
+            _XML_HEAD, uid, _TYPE_ATTR, event_type, _MARKER_EVENT_ATTRS,
+            str(position.lat), _LON_ATTR, str(position.lon),
+            _HAE_ATTR, str(position.hae),
+            _POINT_TAIL_PRECISE, now_iso,
+            _TIME_TO_START, now_iso,
+            _START_TO_STALE, stale_iso,
+            _STALE_TO_CALLSIGN, _xml_escape(callsign), _CALLSIGN_END,
+        ]
+        # Most markers have no remarks; only emit the element when needed
+        if remarks:
+            parts += ('    <remarks>', _xml_escape(remarks), '</remarks>\n')
+        parts += (_LABELS_ON, _EVENT_TAIL)
+        return ''.join(parts)
 
 
 # Example usage
@@ -2,6 +2,9 @@
 Claude Agent SDK Tools for TAK Operations
 
 Natural language interface for creating TAK objects through Claude Code.
+
+The tools share one HTTP session per event loop. Whoever runs them owns that
+loop and must ``await close_client()`` before it exits.
 """
 
 import sys
@@ -18,6 +21,45 @@ from tak_geometry import (
 )
 
 
+# Upper bound on in-flight CoT sends for multi-message tools
+_MAX_CONCURRENT_SENDS = 16
+
+# Shared client so every tool call reuses one HTTP session and connection pool.
+# aiohttp sessions are bound to the loop that created them, so the client is
+# cached per running loop and rebuilt when a new loop (e.g. a second
+# asyncio.run()) calls a tool.
+_shared_client: Optional[OmniTAKClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_client() -> OmniTAKClient:
+    """Return the shared OmniTAKClient for the running loop, connecting on first use"""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client_loop is not loop:
+        # A client left behind by a previous loop cannot be closed from this
+        # one; its loop has already shut down, so just drop it
+        _shared_client = OmniTAKClient()
+        _shared_client_loop = loop
+        await _shared_client.connect()
+    return _shared_client
+
+
+async def close_client():
+    """
+    Close the shared OmniTAKClient session
+
+    The host that runs these tools owns the event loop and must await this
+    before the loop exits (e.g. in the finally block around its agent
+    session); otherwise aiohttp warns about an unclosed session at exit.
+    """
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None and _shared_client_loop is asyncio.get_running_loop():
+        await _shared_client.close()
+    _shared_client = None
+    _shared_client_loop = None
+
+
 # Claude Agent SDK tool decorators
 # NOTE: Uncomment when claude-agent-sdk is installed
 # from claude_agent_sdk import tool
@@ -56,8 +98,8 @@ async def create_exclusion_zone(
     cot_message = builder.create_circle_event(circle, zone_name, color)
 
     try:
-        async with OmniTAKClient() as client:
-            result = await client.send_cot_message(cot_message)
+        client = await _get_client()
+        result = await client.send_cot_message(cot_message)
 
         return f"✓ Created {zone_name}: {radius_km}km radius at ({center_lat}, {center_lon}). Sent to {result['sent_to_count']} TAK server(s)."
     except OmniTAKError as e:
@@ -95,8 +137,8 @@ async def create_area_polygon(
     cot_message = builder.create_polygon_event(polygon, area_name, color, filled)
 
     try:
-        async with OmniTAKClient() as client:
-            result = await client.send_cot_message(cot_message)
+        client = await _get_client()
+        result = await client.send_cot_message(cot_message)
 
         return f"✓ Created polygon '{area_name}' with {len(vertices)} vertices. Sent to {result['sent_to_count']} TAK server(s)."
     except OmniTAKError as e:
@@ -136,10 +178,16 @@ async def create_patrol_route(
     cot_messages = builder.create_route_event(route, route_name, color)
 
     try:
-        async with OmniTAKClient() as client:
-            # Send all messages (route + waypoints)
-            for msg in cot_messages:
-                await client.send_cot_message(msg)
+        client = await _get_client()
+
+        # Send all messages (route + waypoints) concurrently; the server
+        # doesn't depend on the order they arrive in
+        results = await client.send_cot_messages(
+            cot_messages, concurrency=_MAX_CONCURRENT_SENDS
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
         return f"✓ Created route '{route_name}' with {len(waypoints)} waypoints. Sent to TAK server(s)."
     except OmniTAKError as e:
@@ -177,8 +225,8 @@ async def place_marker(
     cot_message = builder.create_marker_event(position, callsign, marker_type, remarks)
 
     try:
-        async with OmniTAKClient() as client:
-            result = await client.send_cot_message(cot_message)
+        client = await _get_client()
+        result = await client.send_cot_message(cot_message)
 
         return f"✓ Placed {marker_type} marker '{callsign}' at ({lat}, {lon}). Sent to {result['sent_to_count']} TAK server(s)."
     except OmniTAKError as e:
@@ -198,29 +246,32 @@ async def get_tak_status() -> str:
         Claude calls: get_tak_status()
     """
     try:
-        async with OmniTAKClient() as client:
-            status = await client.get_status()
-            connections = await client.get_connections()
+        client = await _get_client()
+        status = await client.get_status()
+        connections = await client.get_connections()
 
         active = len([c for c in connections if c.status == 'connected'])
         total = len(connections)
 
-        result = f"omniTAK Status:\n"
-        result += f"  Version: {status.version}\n"
-        result += f"  Uptime: {status.uptime_seconds}s\n"
-        result += f"  Active connections: {active}/{total}\n"
-        result += f"  Messages processed: {status.messages_processed}\n"
-        result += f"  Messages/sec: {status.messages_per_second:.2f}\n"
-        result += f"  Memory: {status.memory_usage_bytes / 1024 / 1024:.1f} MB\n\n"
-
-        result += "Connections:\n"
+        parts = [
+            "omniTAK Status:\n",
+            f"  Version: {status.version}\n",
+            f"  Uptime: {status.uptime_seconds}s\n",
+            f"  Active connections: {active}/{total}\n",
+            f"  Messages processed: {status.messages_processed}\n",
+            f"  Messages/sec: {status.messages_per_second:.2f}\n",
+            f"  Memory: {status.memory_usage_bytes / 1024 / 1024:.1f} MB\n\n",
+            "Connections:\n",
+        ]
         for conn in connections:
             status_icon = "✓" if conn.status == 'connected' else "✗"
-            result += f"  {status_icon} {conn.name}: {conn.address} ({conn.connection_type})\n"
-            result += f"      RX: {conn.messages_received} msgs, {conn.bytes_received} bytes\n"
-            result += f"      TX: {conn.messages_sent} msgs, {conn.bytes_sent} bytes\n"
+            parts += (
+                f"  {status_icon} {conn.name}: {conn.address} ({conn.connection_type})\n",
+                f"      RX: {conn.messages_received} msgs, {conn.bytes_received} bytes\n",
+                f"      TX: {conn.messages_sent} msgs, {conn.bytes_sent} bytes\n",
+            )
 
-        return result
+        return "".join(parts)
     except OmniTAKError as e:
         return f"✗ Failed to get status: {e}"
 
@@ -5,58 +5,60 @@ Demo script to create and send a polygon to TAK via omniTAK API
 
 import asyncio
 import aiohttp
+import orjson
+from typing import Optional
 from claude_tools.tak_geometry import CotMessageBuilder, Polygon, LatLon
 
-async def send_cot_message(api_url: str, cot_xml: str):
-    """Send a CoT message to omniTAK API"""
-    async with aiohttp.ClientSession() as session:
-        # Login first to get token
-        login_data = {
-            "username": "admin",
-            "password": "changeme"
-        }
-
-        async with session.post(f"{api_url}/api/v1/auth/login", json=login_data) as resp:
-            if resp.status != 200:
-                print(f"Login failed: {resp.status}")
-                return False
-
-            result = await resp.json()
-            token = result.get("access_token")
-
-        if not token:
-            print("Failed to get authentication token")
+async def _login(session: aiohttp.ClientSession, api_url: str) -> Optional[str]:
+    """Log in to omniTAK API and return the access token"""
+    login_data = {
+        "username": "admin",
+        "password": "changeme"
+    }
+
+    async with session.post(
+        f"{api_url}/api/v1/auth/login",
+        data=orjson.dumps(login_data),
+        headers={"Content-Type": "application/json"}
+    ) as resp:
+        if resp.status != 200:
+            print(f"Login failed: {resp.status}")
+            return None
+
+        result = orjson.loads(await resp.read())
+        return result.get("access_token")
+
+async def send_cot_message(
+    session: aiohttp.ClientSession, token: str, api_url: str, cot_xml: str
+):
+    """Send a CoT message to omniTAK API using an authenticated session"""
+    # Send CoT message using JSON request format
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+
+    # Format as SendCotRequest JSON
+    request_data = {
+        "message": cot_xml,
+        "apply_filters": False,  # Bypass filters for demo
+        "priority": 5
+    }
+
+    async with session.post(
+        f"{api_url}/api/v1/cot/send",
+        data=orjson.dumps(request_data),
+        headers=headers
+    ) as resp:
+        if resp.status == 200:
+            print(f"✅ Polygon sent successfully!")
+            return True
+        else:
+            print(f"❌ Failed to send polygon: {resp.status}")
+            text = await resp.text()
+            print(f"Response: {text}")
             return False
 
-        print(f"✅ Authenticated successfully")
-
-        # Send CoT message using JSON request format
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
-        # Format as SendCotRequest JSON
-        request_data = {
-            "message": cot_xml,
-            "apply_filters": False,  # Bypass filters for demo
-            "priority": 5
-        }
-
-        async with session.post(
-            f"{api_url}/api/v1/cot/send",
-            json=request_data,
-            headers=headers
-        ) as resp:
-            if resp.status == 200:
-                print(f"✅ Polygon sent successfully!")
-                return True
-            else:
-                print(f"❌ Failed to send polygon: {resp.status}")
-                text = await resp.text()
-                print(f"Response: {text}")
-                return False
-
 async def main():
     print("=" * 80)
     print("OmniTAK Claude Demo - Creating TAK Polygon")
@@ -99,7 +101,15 @@ async def main():
     print(f"🚀 Sending polygon to omniTAK API at {api_url}")
     print()
 
-    success = await send_cot_message(api_url, cot_xml)
+    # One session and login for every message sent in this run
+    async with aiohttp.ClientSession() as session:
+        token = await _login(session, api_url)
+        if token:
+            print(f"✅ Authenticated successfully")
+            success = await send_cot_message(session, token, api_url, cot_xml)
+        else:
+            print("Failed to get authentication token")
+            success = False
 
     if success:
         print()
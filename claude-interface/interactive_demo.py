@@ -4,27 +4,51 @@ Interactive OmniTAK Demo - Type commands to create TAK objects in real-time
 """
 
 import asyncio
+import os
+import sys
 import aiohttp
+from typing import Optional
 from claude_tools.tak_geometry import CotMessageBuilder, Circle, Polygon, Route, LatLon
 
 # Global API configuration
 API_URL = "http://127.0.0.1:9443"
 TOKEN = None
-
-async def login():
-    """Login and get authentication token"""
-    global TOKEN
-    async with aiohttp.ClientSession() as session:
-        login_data = {
-            "username": "admin",
-            "password": "changeme"
-        }
-        async with session.post(f"{API_URL}/api/v1/auth/login", json=login_data) as resp:
-            if resp.status == 200:
-                result = await resp.json()
-                TOKEN = result.get("access_token")
-                return True
-            return False
+AUTH_HEADERS = {}  # Built once at login, reused by every send
+
+# Cap on concurrent CoT sends; bounds bursts (e.g. routes) without fixed sleeps
+SEND_LIMIT = asyncio.Semaphore(8)
+
+# Shared HTTP session (created in main) so every request reuses pooled connections
+SESSION: Optional[aiohttp.ClientSession] = None
+
+# Raw stdin bytes read by ainput but not yet returned as lines
+STDIN_BUFFER = bytearray()
+STDIN_EOF = False
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the HTTP session shared by login and send_cot"""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75)
+    )
+
+async def login(session: aiohttp.ClientSession):
+    """Login on the shared session and store the authentication token"""
+    global TOKEN, AUTH_HEADERS
+    login_data = {
+        "username": "admin",
+        "password": "changeme"
+    }
+    async with session.post(f"{API_URL}/api/v1/auth/login", json=login_data) as resp:
+        if resp.status == 200:
+            result = await resp.json()
+            TOKEN = result.get("access_token")
+            AUTH_HEADERS = {
+                "Authorization": f"Bearer {TOKEN}",
+                "Content-Type": "application/json"
+            }
+            return True
+        return False
 
 async def send_cot(cot_xml, description="TAK Object"):
     """Send CoT message to omniTAK API"""
@@ -32,56 +56,119 @@ async def send_cot(cot_xml, description="TAK Object"):
         print("❌ Not authenticated. Please restart.")
         return False
 
-    async with aiohttp.ClientSession() as session:
-        headers = {
-            "Authorization": f"Bearer {TOKEN}",
-            "Content-Type": "application/json"
-        }
-
-        request_data = {
-            "message": cot_xml,
-            "apply_filters": False,
-            "priority": 5
-        }
-
-        async with session.post(
-            f"{API_URL}/api/v1/cot/send",
-            json=request_data,
-            headers=headers
-        ) as resp:
-            if resp.status == 200:
-                result = await resp.json()
-                print(f"✅ {description} sent successfully! (ID: {result['message_id'][:8]}...)")
-                return True
-            else:
-                text = await resp.text()
-                print(f"❌ Failed to send: {resp.status} - {text}")
-                return False
+    request_data = {
+        "message": cot_xml,
+        "apply_filters": False,
+        "priority": 5
+    }
+
+    async with SEND_LIMIT, SESSION.post(
+        f"{API_URL}/api/v1/cot/send",
+        json=request_data,
+        headers=AUTH_HEADERS
+    ) as resp:
+        if resp.status == 200:
+            result = await resp.json()
+            print(f"✅ {description} sent successfully! (ID: {result['message_id'][:8]}...)")
+            return True
+        else:
+            text = await resp.text()
+            print(f"❌ Failed to send: {resp.status} - {text}")
+            return False
+
+async def read_stdin_line() -> bytes:
+    """Return the next stdin line (b"" at EOF), waiting on the event loop
+
+    Bytes come straight from the file descriptor into STDIN_BUFFER, so lines
+    that arrive together in one read are all returned without waiting for
+    more input.
+    """
+    global STDIN_EOF
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+
+    while True:
+        end = STDIN_BUFFER.find(b"\n") + 1
+        if end or (STDIN_EOF and STDIN_BUFFER):
+            end = end or len(STDIN_BUFFER)
+            line = bytes(STDIN_BUFFER[:end])
+            del STDIN_BUFFER[:end]
+            return line
+        if STDIN_EOF:
+            return b""
+
+        readable = loop.create_future()
+
+        def on_readable():
+            if not readable.done():
+                readable.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+
+        chunk = os.read(fd, 65536)
+        if chunk:
+            STDIN_BUFFER.extend(chunk)
+        else:
+            STDIN_EOF = True
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop
+
+    Background work on the loop (e.g. session keep-alive) keeps running
+    while the user types.
+    """
+    print(prompt, end="", flush=True)
+
+    try:
+        raw = await read_stdin_line()
+    except (NotImplementedError, PermissionError, ValueError):
+        # add_reader is unsupported (Windows proactor loop) or stdin is a
+        # regular file: read on a worker thread instead
+        line = await asyncio.to_thread(sys.stdin.readline)
+    else:
+        line = raw.decode(sys.stdin.encoding or "utf-8", errors="replace")
+
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
 def parse_coords(coord_str):
     """Parse coordinates from string like '34.0,-118.0' or '34.0 -118.0'"""
-    parts = coord_str.replace(',', ' ').split()
+    # Common "lat,lon" form first; fall back to whitespace separated
+    parts = coord_str.split(',') if ',' in coord_str else coord_str.split()
     if len(parts) >= 2:
-        return float(parts[0]), float(parts[1])
+        try:
+            return float(parts[0]), float(parts[1])
+        except ValueError:
+            pass
     return None, None
 
+HELP_TEXT = "\n".join([
+    "",
+    "📍 Available Commands:",
+    "=" * 80,
+    "  polygon <lat,lon> <lat,lon> <lat,lon> [name] [color]",
+    "    Example: polygon 34.0,-118.0 34.0,-117.0 33.5,-117.0 MyArea blue",
+    "",
+    "  circle <lat,lon> <radius_km> [name] [color]",
+    "    Example: circle 34.0522,-118.2437 5 LAX_Zone red",
+    "",
+    "  route <lat,lon:name> <lat,lon:name> <lat,lon:name> [route_name] [color]",
+    "    Example: route 34.0,-118.0:Start 34.1,-118.1:Mid 34.2,-118.2:End Patrol yellow",
+    "",
+    "  help     - Show this help",
+    "  quit     - Exit program",
+    "=" * 80,
+    "",
+]) + "\n"
+
 def print_help():
     """Print available commands"""
-    print("\n📍 Available Commands:")
-    print("=" * 80)
-    print("  polygon <lat,lon> <lat,lon> <lat,lon> [name] [color]")
-    print("    Example: polygon 34.0,-118.0 34.0,-117.0 33.5,-117.0 MyArea blue")
-    print()
-    print("  circle <lat,lon> <radius_km> [name] [color]")
-    print("    Example: circle 34.0522,-118.2437 5 LAX_Zone red")
-    print()
-    print("  route <lat,lon:name> <lat,lon:name> <lat,lon:name> [route_name] [color]")
-    print("    Example: route 34.0,-118.0:Start 34.1,-118.1:Mid 34.2,-118.2:End Patrol yellow")
-    print()
-    print("  help     - Show this help")
-    print("  quit     - Exit program")
-    print("=" * 80)
-    print()
+    sys.stdout.write(HELP_TEXT)
 
 async def handle_polygon_command(parts):
     """Handle polygon creation command"""
@@ -210,22 +297,28 @@ async def handle_route_command(parts):
     route = Route(waypoints=waypoints)
     route_msgs = builder.create_route_event(route, name, color)
 
-    # Send all route messages (main route + waypoints)
-    for idx, msg in enumerate(route_msgs):
-        if idx == 0:
-            await send_cot(msg, f"Route '{name}'")
-        else:
-            await send_cot(msg, f"  Waypoint {idx}")
-            await asyncio.sleep(0.1)  # Small delay between waypoints
-
-async def main():
+    # Send all route messages (main route + waypoints) concurrently
+    await asyncio.gather(*(
+        send_cot(msg, f"  Waypoint {idx}" if idx else f"Route '{name}'")
+        for idx, msg in enumerate(route_msgs)
+    ))
+
+# Object-creation commands, dispatched by name from the REPL
+COMMAND_HANDLERS = {
+    'polygon': handle_polygon_command,
+    'circle': handle_circle_command,
+    'route': handle_route_command,
+}
+
+async def run_demo():
+    """Log in and run the interactive command loop"""
     print("\n" + "=" * 80)
     print("🎯 OmniTAK Interactive Demo - Claude-Powered TAK Object Creator")
     print("=" * 80)
     print()
     print("Connecting to omniTAK API...")
 
-    if not await login():
+    if not await login(SESSION):
         print("❌ Failed to authenticate with omniTAK API")
         print("   Make sure the server is running:")
         print("   cd /Users/iesouskurios/omniTAK && target/release/omnitak --config config.yaml")
@@ -240,7 +333,7 @@ async def main():
     while True:
         try:
             # Get user input
-            user_input = input("\n🎯 > ").strip()
+            user_input = (await ainput("\n🎯 > ")).strip()
 
             if not user_input:
                 continue
@@ -249,22 +342,17 @@ async def main():
             parts = user_input.split()
             command = parts[0].lower()
 
-            if command == 'quit' or command == 'exit':
+            handler = COMMAND_HANDLERS.get(command)
+            if handler:
+                await handler(parts)
+
+            elif command == 'quit' or command == 'exit':
                 print("\n👋 Goodbye!\n")
                 break
 
             elif command == 'help':
                 print_help()
 
-            elif command == 'polygon':
-                await handle_polygon_command(parts)
-
-            elif command == 'circle':
-                await handle_circle_command(parts)
-
-            elif command == 'route':
-                await handle_route_command(parts)
-
             else:
                 print(f"❌ Unknown command: {command}")
                 print("   Type 'help' for available commands")
@@ -272,9 +360,31 @@ async def main():
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted. Goodbye!\n")
             break
+        except EOFError:
+            print("\n👋 Goodbye!\n")
+            break
         except Exception as e:
             print(f"❌ Error: {e}")
             print("   Type 'help' for correct command format")
 
+async def main():
+    global SESSION
+    SESSION = create_session()
+    try:
+        await run_demo()
+    finally:
+        await SESSION.close()
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Ctrl-C cancels main(), which closes the session before we get here
+        print("\n\n👋 Interrupted. Goodbye!\n")
@@ -9,13 +9,52 @@ import asyncio
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
-import json
+import functools
 import logging
+import sys
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _orjson_dumps_str(obj: Any) -> str:
+    """JSON-encode request bodies with orjson (aiohttp expects a str)"""
+    return orjson.dumps(obj).decode()
+
+
+# Only replayed broadcasts of identical XML hit the encode cache (builder
+# output carries a fresh uid and timestamp), so keep it small and skip
+# large documents that would otherwise be pinned twice (str + bytes)
+_SEND_CACHE_SIZE = 128
+_SEND_CACHE_MAX_XML = 4096
+
+
+def _encode_send_cot(cot_xml: str, apply_filters: bool, priority: int) -> bytes:
+    """JSON-encode a broadcast send request"""
+    return orjson.dumps({
+        "message": cot_xml,
+        "apply_filters": apply_filters,
+        "priority": priority
+    })
+
+
+_encode_send_cot_cached = functools.lru_cache(maxsize=_SEND_CACHE_SIZE)(_encode_send_cot)
+
+
+async def _error_message(response: aiohttp.ClientResponse) -> str:
+    """Extract the server's error message from a failed response"""
+    raw = await response.read()
+    try:
+        error_data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        error_data = None
+
+    if isinstance(error_data, dict) and 'message' in error_data:
+        return error_data['message']
+    return raw.decode("utf-8", "replace") or (response.reason or "")
+
+
+@dataclass(slots=True)
 class ConnectionInfo:
     """TAK server connection information"""
     id: str
@@ -29,7 +68,7 @@ class ConnectionInfo:
     bytes_sent: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus:
     """omniTAK system status"""
     uptime_seconds: int
@@ -82,6 +121,8 @@ class OmniTAKClient:
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.session: Optional[aiohttp.ClientSession] = None
         self._token: Optional[str] = None
+        # Per-request auth headers; rebuilt only when credentials change
+        self._headers: Dict[str, str] = {"X-API-Key": api_key} if api_key else {}
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -95,7 +136,19 @@ class OmniTAKClient:
     async def connect(self):
         """Create HTTP session"""
         if self.session is None:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector,
+                headers={"Content-Type": "application/json"},
+                json_serialize=_orjson_dumps_str
+            )
 
     async def close(self):
         """Close HTTP session"""
@@ -103,23 +156,13 @@ class OmniTAKClient:
             await self.session.close()
             self.session = None
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers with authentication"""
-        headers = {"Content-Type": "application/json"}
-
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        elif self.api_key:
-            headers["X-API-Key"] = self.api_key
-
-        return headers
-
     async def _request(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        body: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """
         Make HTTP request to omniTAK API
@@ -129,6 +172,7 @@ class OmniTAKClient:
             endpoint: API endpoint (e.g., "/api/v1/status")
             data: Request body (for POST/PUT)
             params: Query parameters
+            body: Pre-encoded JSON request body, used instead of data
 
         Returns:
             Response JSON as dictionary
@@ -140,30 +184,24 @@ class OmniTAKClient:
             await self.connect()
 
         url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
 
         try:
             async with self.session.request(
-                method, url, json=data, params=params, headers=headers
+                method, url, json=data, data=body, params=params,
+                headers=self._headers
             ) as response:
-                response_text = await response.text()
-
-                if response.status >= 400:
-                    try:
-                        error_data = json.loads(response_text)
-                        error_msg = error_data.get('message', response_text)
-                    except json.JSONDecodeError:
-                        error_msg = response_text
-
+                if not response.ok:
+                    error_msg = await _error_message(response)
                     raise OmniTAKError(
                         f"API error {response.status}: {error_msg}"
                     )
 
-                return json.loads(response_text)
+                raw = await response.read()
+                return orjson.loads(raw) if raw else {}
 
         except aiohttp.ClientError as e:
             raise OmniTAKError(f"HTTP request failed: {e}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise OmniTAKError(f"Invalid JSON response: {e}")
 
     async def login(self, username: str, password: str) -> str:
@@ -184,7 +222,8 @@ class OmniTAKClient:
         )
 
         self._token = response["token"]
-        logger.info(f"Logged in as {username}")
+        self._headers = {"Authorization": f"Bearer {self._token}"}
+        logger.info("Logged in as %s", username)
         return self._token
 
     async def get_status(self) -> SystemStatus:
@@ -227,9 +266,8 @@ class OmniTAKClient:
         """
         data = await self._request("GET", "/api/v1/connections")
 
-        connections = []
-        for conn in data.get("connections", []):
-            connections.append(ConnectionInfo(
+        return [
+            ConnectionInfo(
                 id=conn["id"],
                 name=conn["name"],
                 connection_type=conn["connection_type"],
@@ -239,9 +277,9 @@ class OmniTAKClient:
                 messages_sent=conn.get("messages_sent", 0),
                 bytes_received=conn.get("bytes_received", 0),
                 bytes_sent=conn.get("bytes_sent", 0)
-            ))
-
-        return connections
+            )
+            for conn in data.get("connections", [])
+        ]
 
     async def send_cot_message(
         self,
@@ -275,28 +313,63 @@ class OmniTAKClient:
             >>> response = await client.send_cot_message(cot_xml)
             >>> print(f"Sent to {response['sent_to_count']} servers")
         """
-        data = {
-            "message": cot_xml,
-            "apply_filters": apply_filters,
-            "priority": priority
-        }
-
         if target_connections:
-            data["target_connections"] = target_connections
-
-        response = await self._request("POST", "/api/v1/cot/send", data=data)
-
-        if response.get("warnings"):
-            for warning in response["warnings"]:
-                logger.warning(f"CoT message warning: {warning}")
-
+            body = orjson.dumps({
+                "message": cot_xml,
+                "apply_filters": apply_filters,
+                "priority": priority,
+                "target_connections": target_connections
+            })
+        else:
+            # Small broadcasts are cached, so replayed messages skip encoding
+            encode = (_encode_send_cot_cached if len(cot_xml) <= _SEND_CACHE_MAX_XML
+                      else _encode_send_cot)
+            body = encode(cot_xml, apply_filters, priority)
+
+        response = await self._request("POST", "/api/v1/cot/send", body=body)
+
+        for warning in response.get("warnings") or ():
+            logger.warning("CoT message warning: %s", warning)
+
+        # Lazy %-style args: nothing is formatted when INFO is disabled
         logger.info(
-            f"CoT message {response['message_id']} sent to "
-            f"{response['sent_to_count']} connection(s)"
+            "CoT message %s sent to %s connection(s)",
+            response['message_id'], response['sent_to_count']
         )
 
         return response
 
+    async def send_cot_messages(
+        self,
+        messages: List[str],
+        *,
+        concurrency: int = 32,
+        **options
+    ) -> List[Any]:
+        """
+        Send many CoT messages concurrently
+
+        Args:
+            messages: CoT messages in XML format
+            concurrency: Maximum number of sends in flight at once
+            **options: Passed to send_cot_message (target_connections,
+                       apply_filters, priority)
+
+        Returns:
+            One entry per message, in order: the send_cot_message response
+            dictionary, or the exception raised while sending that message
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send_one(cot_xml: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.send_cot_message(cot_xml, **options)
+
+        return await asyncio.gather(
+            *(send_one(cot_xml) for cot_xml in messages),
+            return_exceptions=True
+        )
+
     async def create_connection(
         self,
         name: str,
@@ -324,7 +397,7 @@ class OmniTAKClient:
         }
 
         response = await self._request("POST", "/api/v1/connections", data=data)
-        logger.info(f"Created connection {name} to {address}")
+        logger.info("Created connection %s to %s", name, address)
         return response
 
     async def delete_connection(self, connection_id: str) -> Dict[str, Any]:
@@ -340,7 +413,7 @@ class OmniTAKClient:
         response = await self._request(
             "DELETE", f"/api/v1/connections/{connection_id}"
         )
-        logger.info(f"Deleted connection {connection_id}")
+        logger.info("Deleted connection %s", connection_id)
         return response
 
 
@@ -357,18 +430,21 @@ async def main():
 
         # Get system status
         status = await client.get_status()
-        print(f"omniTAK v{status.version}")
-        print(f"Uptime: {status.uptime_seconds}s")
-        print(f"Active connections: {status.active_connections}")
-        print(f"Messages/sec: {status.messages_per_second:.2f}")
+        lines = [
+            f"omniTAK v{status.version}",
+            f"Uptime: {status.uptime_seconds}s",
+            f"Active connections: {status.active_connections}",
+            f"Messages/sec: {status.messages_per_second:.2f}",
+        ]
 
         # Get connections
         connections = await client.get_connections()
-        print(f"\nConnections ({len(connections)}):")
+        lines.append(f"\nConnections ({len(connections)}):")
         for conn in connections:
-            print(f"  {conn.name}: {conn.status} ({conn.address})")
-            print(f"    RX: {conn.messages_received} msgs, {conn.bytes_received} bytes")
-            print(f"    TX: {conn.messages_sent} msgs, {conn.bytes_sent} bytes")
+            lines.append(f"  {conn.name}: {conn.status} ({conn.address})")
+            lines.append(f"    RX: {conn.messages_received} msgs, {conn.bytes_received} bytes")
+            lines.append(f"    TX: {conn.messages_sent} msgs, {conn.bytes_sent} bytes")
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Send a test CoT message
         test_cot = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -380,10 +456,13 @@ async def main():
 </event>'''
 
         response = await client.send_cot_message(test_cot)
-        print(f"\nSent CoT message {response['message_id']}")
-        print(f"  Delivered to {response['sent_to_count']} connection(s)")
+        lines = [
+            f"\nSent CoT message {response['message_id']}",
+            f"  Delivered to {response['sent_to_count']} connection(s)",
+        ]
         if response['warnings']:
-            print(f"  Warnings: {response['warnings']}")
+            lines.append(f"  Warnings: {response['warnings']}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -393,5 +472,12 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     # Run example
     asyncio.run(main())